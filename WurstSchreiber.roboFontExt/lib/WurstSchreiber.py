@@ -2,11 +2,13 @@
 # Many thanks to Just van Rossum
 # Update to RF4 by Roberto Arista and Frederik Berlaen
 
-from fontTools.misc.bezierTools import splitCubicAtT
 from fontTools.pens.basePen import BasePen
-from fontTools.pens.recordingPen import RecordingPen
+from fontTools.pens.recordingPen import RecordingPen, DecomposingRecordingPen, replayRecording
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import math
 import vanilla
+from PyObjCTools.AppHelper import callAfter
 
 from mojo.roboFont import CurrentGlyph
 from mojo.extensions import getExtensionDefault, setExtensionDefault
@@ -19,45 +21,23 @@ from mojo.events import postEvent
 # constants
 KAPPA = 4*(math.sqrt(2)-1)/3
 CURVE_CORRECTION = 1.25
+# knot quad in (tangent, normal) coordinates, scaled by -radius*CURVE_CORRECTION
+KNOT_LOCAL = ((0, -.1), (.5, -.25), (.5, .25), (0, .1))
 
 
-class Vector(object):
-
-    def __init__(self, v):
-        self.v = v
-
-    def __add__(self, other):
-        x, y = self.v
-        x2, y2 = other
-        return Vector((x+x2, y+y2))
-
-    def __sub__(self, other):
-        x, y = self.v
-        x2, y2 = other
-        return Vector((x-x2, y-y2))
-
-    def __mul__(self, m):
-        x, y = self.v
-        return Vector((x*m, y*m))
-
-    def __div__(self, d):
-        x, y = self.v
-        return Vector((x/d, y/d))
-
-    def __iter__(self):
-        return iter(self.v)
-
-
-def calcCubicParameters(pt1, pt2, pt3, pt4):
-    pt1 = Vector(pt1)
-    pt2 = Vector(pt2)
-    pt3 = Vector(pt3)
-    pt4 = Vector(pt4)
-    d = pt1
-    c = (pt2 - d) * 3.0
-    b = (pt3 - pt2) * 3.0 - c
-    a = pt4 - d - c - b
-    return a, b, c, d
+def splitTangentForm(p, d, t0, t1, s1, s2):
+    # A cubic in tangent form: start point p, chord d = p3-p0 and end
+    # tangents t0 = p1-p0, t1 = p3-p2 (all complex). Returns the piece
+    # between s1 and s2 in the same form, without differencing nearby points.
+    e = d - t0 - t1
+    u1 = 1 - s1
+    u2 = 1 - s2
+    q1 = d * (s1 * s1 * (3 - 2 * s1)) + 3 * u1 * s1 * (u1 * t0 - s1 * t1)
+    q2 = d * (s2 * s2 * (3 - 2 * s2)) + 3 * u2 * s2 * (u2 * t0 - s2 * t1)
+    k = s2 - s1
+    r0 = k * (u1 * u1 * t0 + 2 * u1 * s1 * e + s1 * s1 * t1)
+    r1 = k * (u2 * u2 * t0 + 2 * u2 * s2 * e + s2 * s2 * t1)
+    return p + q1, q2 - q1, r0, r1
 
 
 def calcAngle(a, b, c):
@@ -77,86 +57,13 @@ def calcAngle(a, b, c):
 def distance(pt_a, pt_b):
     ax, ay = pt_a
     bx, by = pt_b
-    return math.sqrt((bx-ax)**2 + (by-ay)**2)
+    return math.hypot(bx-ax, by-ay)
 
 
-def slope(pt_a, pt_b):
-    ax, ay = pt_a
-    bx, by = pt_b
-    return (bx-ax), (by-ay)
-
-
-def normalise(a, b):
-    n = math.sqrt((a*a)+(b*b))
-    if n != 0:
-        return (a/n, b/n)
-    else:
-        return (0, 0)
-
-
-def interpolate(pt_a, pt_b, f):
-    ax, ay = pt_a
-    bx, by = pt_b
-    cx = ax + f * (bx - ax)
-    cy = ay + f * (by - ay)
-    return (cx, cy)
-
-
-def offsetPoint(pt_a, pt_n, radius):
-    ax, ay = pt_a
-    nx, ny = pt_n
-    px = ax+nx*radius
-    py = ay+ny*radius
-    return (px, py)
-
-
-def arcControlPoint(pt_a, pt_n, radius):
-    ax, ay = pt_a
-    nx, ny = pt_n
-    px = ax+nx*radius*KAPPA
-    py = ay+ny*radius*KAPPA
-    return (px, py)
-
-
-def arcControlPoints(a, an, b, bn, radius):
-    p1 = arcControlPoint(a, an, radius)
-    p2 = arcControlPoint(b, bn, radius)
-    return p1, p2
-
-
-def splitCubicAtLength(p0, p1, p2, p3, length):
-    a, b, c, d = calcCubicParameters(p0, p1, p2, p3)
-    a1 = a * 3.0
-    b1 = b * 2.0
-    c1 = c
-    t = 0
-    dx, dy = a1 * t ** 2 + b1 * t + c1
-    velocity = math.sqrt(dx ** 2 + dy ** 2)
-    s = length / velocity
-    return s
-
-
-def splitLineAt(p0, p1, length):
-    ldistance = distance(p0, p1)
-    x1, y1 = p0
-    x2, y2 = p1
-    x = x1+(length/ldistance)*(x2-x1)
-    y = y1+(length/ldistance)*(y2-y1)
-    return x, y
-
-
-def calcTriangleSSA(angle, side1, side2):
-    knownAngle = math.degrees(angle)
-    knownSide = side1
-    partialSide = side2
-    ratio = knownSide / math.sin(math.radians(knownAngle))
-    if ratio == 0:
-        return 0
-    temp = partialSide / ratio
-    partialAngle = math.degrees(math.asin(temp))
-    unknownAngle = 180 - knownAngle - partialAngle
-    unknownSide = ratio * math.sin(math.radians(unknownAngle))   # Law of sines
-    return unknownSide
+def normalise(a, b, _hypot=math.hypot):
+    n = _hypot(a, b)
+    inv = 1.0/n if n else 0.0
+    return (a*inv, b*inv)
 
 
 class WurstPen(BasePen):
@@ -164,6 +71,7 @@ class WurstPen(BasePen):
     def __init__(self, glyphSet, pen, radius):
         super().__init__(glyphSet)
         self.radius = radius
+        self.capRadius = radius*CURVE_CORRECTION
         self.pen = pen
 
     def _moveTo(self, pt1):
@@ -173,17 +81,17 @@ class WurstPen(BasePen):
     def _lineTo(self, pt1):
         pt0 = self._getCurrentPoint()
         if self._prevPoint is None:
-            self.drawWurstKnot(pt0, pt1, self.radius)
+            self.drawWurstKnot(pt0, pt1, self.capRadius)
         margin = self.calcWurstMargin(pt0, pt1)
-        self.drawLineWurst(pt0, pt1, self.radius, margin)
+        replayRecording(_computeLineWurst(pt0, pt1, self.radius, margin), self.pen)
         self._prevPoint = pt0
 
     def _curveToOne(self, pt1, pt2, pt3):
         pt0 = self._getCurrentPoint()
         if self._prevPoint is None:
-            self.drawWurstKnot(pt0, pt1, self.radius)
+            self.drawWurstKnot(pt0, pt1, self.capRadius)
         margin = self.calcWurstMargin(pt0, pt1)
-        self.drawCurveWurst(pt0, pt1, pt2, pt3, self.radius, margin)
+        replayRecording(_computeCurveWurst(pt0, pt1, pt2, pt3, self.radius, margin), self.pen)
         self._prevPoint = pt2
 
     def _closePath(self):
@@ -194,34 +102,29 @@ class WurstPen(BasePen):
         if self._prevPoint is not None:
             pt0 = self._prevPoint
             pt1 = self._getCurrentPoint()
-            self.drawWurstKnot(pt1, pt0, self.radius)
+            self.drawWurstKnot(pt1, pt0, self.capRadius)
         self._prevPoint = self._getCurrentPoint()
 
     def calcWurstMargin(self, pt0, pt1):
         if self._prevPoint:
             angle = calcAngle(self._prevPoint, pt0, pt1)
-            if angle and math.degrees(angle) != 180:
-                margin = calcTriangleSSA(angle, self.radius * 2, self.radius) - self.radius
+            if angle and abs(angle - math.pi) > 1e-9:
+                # Law of sines on the triangle (angle, 2*radius, radius), in radians
+                sinAngle = math.sin(angle)
+                unknownAngle = math.pi - angle - math.asin(sinAngle / 2)
+                margin = self.radius * (2 * math.sin(unknownAngle) / sinAngle - 1)
             else:
                 margin = 0
         else:
             margin = 0
         return margin
 
-    def drawWurstKnot(self, p0, p1, radius):
-        dx, dy = slope(p0, p1)
-        n = normalise(dx, dy)
-        m = n[1], -n[0]
-
-        o1 = -m[0]*.1, -m[1]*.1
-        o2 = n[0]*.5-m[0]*.25, n[1]*.5-m[1]*.25
-        o3 = n[0]*.5+m[0]*.25, n[1]*.5+m[1]*.25
-        o4 = m[0]*.1, m[1]*.1
-
-        a = offsetPoint(p0, o1, -radius*CURVE_CORRECTION)
-        b = offsetPoint(p0, o2, -radius*CURVE_CORRECTION)
-        c = offsetPoint(p0, o3, -radius*CURVE_CORRECTION)
-        d = offsetPoint(p0, o4, -radius*CURVE_CORRECTION)
+    def drawWurstKnot(self, p0, p1, capRadius):
+        x0, y0 = p0
+        nx, ny = normalise(p1[0]-x0, p1[1]-y0)
+        s = -capRadius
+        # offset along n and the normal m = (ny, -nx) in one step
+        a, b, c, d = [(x0+s*(u*nx+v*ny), y0+s*(u*ny-v*nx)) for u, v in KNOT_LOCAL]
 
         self.pen.moveTo(a)
         self.pen.lineTo(b)
@@ -229,94 +132,156 @@ class WurstPen(BasePen):
         self.pen.lineTo(d)
         self.pen.closePath()
 
-    def drawWurstCap(self, p, n, m, radius):
-        a = offsetPoint(p, m, -radius)
-        d = offsetPoint(p, n, radius*CURVE_CORRECTION)
-        b, c = arcControlPoints(a, (-n[0], -n[1]), d, m, -radius*CURVE_CORRECTION)
-        g = offsetPoint(p, m, radius)
-        e, f = arcControlPoints(d, m, g, n, radius*CURVE_CORRECTION)
+    def drawWurstCap(self, p, n, m, radius, cr, kr):
+        # cr and kr are the pen's capRadius and capRadius*KAPPA, signed like radius
+        px, py = p
+        nx, ny = n
+        mx, my = m
+
+        a = px-mx*radius, py-my*radius
+        d = px+nx*cr, py+ny*cr
+        g = px+mx*radius, py+my*radius
+        b = a[0]+nx*kr, a[1]+ny*kr
+        c = d[0]-mx*kr, d[1]-my*kr
+        e = d[0]+mx*kr, d[1]+my*kr
+        f = g[0]+nx*kr, g[1]+ny*kr
 
         self.pen.curveTo(b, c, d)
         self.pen.curveTo(e, f, g)
 
-    def drawWurstCurveSide(self, p0, p1, p2, p3, m1, m2, cdistance, radius):
-        a = offsetPoint(p0, m1, radius)
-        d = offsetPoint(p3, m2, -radius)
+    def drawWurstCurveSide(self, p0, p1, p2, p3, m1, m2, cdistance, radius, _hypot=math.hypot):
+        x0, y0 = p0
+        x3, y3 = p3
+        m1x, m1y = m1[0]*radius, m1[1]*radius
+        m2x, m2y = m2[0]*radius, m2[1]*radius
+
+        ax, ay = x0+m1x, y0+m1y
+        d = x3-m2x, y3-m2y
 
-        rdistance = distance(a, d)
-        rscale = rdistance/cdistance
+        rscale = _hypot(d[0]-ax, d[1]-ay)/cdistance
 
-        cp1 = interpolate(p0, p1, rscale)
-        cp2 = interpolate(p3, p2, rscale)
-        b = offsetPoint(cp1, m1, radius)
-        c = offsetPoint(cp2, m2, -radius)
+        b = x0+rscale*(p1[0]-x0)+m1x, y0+rscale*(p1[1]-y0)+m1y
+        c = x3+rscale*(p2[0]-x3)-m2x, y3+rscale*(p2[1]-y3)-m2y
 
         self.pen.curveTo(b, c, d)
 
     def drawWurstLineSide(self, p, m, radius):
-        b = offsetPoint(p, m, radius)
-        self.pen.lineTo(b)
+        self.pen.lineTo((p[0]+m[0]*radius, p[1]+m[1]*radius))
 
     def drawCurveWurst(self, p0, p1, p2, p3, radius, margin):
-        if distance(p0, p3) < radius:
+        z0 = complex(*p0)
+        z3 = complex(*p3)
+        d = z3-z0
+        if d.real*d.real+d.imag*d.imag < radius*radius:
             return
         if p0 == p1 or p2 == p3:
             return
 
-        s1 = splitCubicAtLength(p0, p1, p2, p3, radius+margin)
-        s2 = 1-splitCubicAtLength(p3, p2, p1, p0, radius)
-
-        curves = splitCubicAtT(p0, p1, p2, p3, s1, s2)
-        p0, p1, p2, p3 = curves[1]
-
-        dx1, dy1 = slope(p1, p0)
-        dx2, dy2 = slope(p2, p3)
-        n1 = normalise(dx1, dy1)
-        n2 = normalise(dx2, dy2)
+        t0 = complex(*p1)-z0
+        t1 = z3-complex(*p2)
+
+        # the velocity at either end is 3 times the control arm
+        s1 = (radius+margin)/(3*abs(t0))
+        s2 = 1-radius/(3*abs(t1))
+
+        z0, d, t0, t1 = splitTangentForm(z0, d, t0, t1, s1, s2)
+        z3 = z0+d
+        z1 = z0+t0
+        z2 = z3-t1
+        p0 = z0.real, z0.imag
+        p1 = z1.real, z1.imag
+        p2 = z2.real, z2.imag
+        p3 = z3.real, z3.imag
+
+        # normals come straight from the end tangents
+        l1 = abs(t0)
+        l2 = abs(t1)
+        inv1 = 1.0/l1 if l1 else 0.0
+        inv2 = 1.0/l2 if l2 else 0.0
+        n1 = -t0.real*inv1, -t0.imag*inv1
+        n2 = t1.real*inv2, t1.imag*inv2
         m1 = n1[1], -n1[0]
         m2 = n2[1], -n2[0]
 
-        cdistance = distance(p0, p3)
+        cdistance = abs(d)
 
-        start = offsetPoint(p0, m1, -radius)
-        self.pen.moveTo(start)
-        self.drawWurstCap(p0, n1, m1, radius)
+        kr = self.capRadius*KAPPA
+
+        self.pen.moveTo((p0[0]-m1[0]*radius, p0[1]-m1[1]*radius))
+        self.drawWurstCap(p0, n1, m1, radius, self.capRadius, kr)
         self.drawWurstCurveSide(p0, p1, p2, p3, m1, m2, cdistance, radius)
-        self.drawWurstCap(p3, n2, m2, radius)
+        self.drawWurstCap(p3, n2, m2, radius, self.capRadius, kr)
         self.drawWurstCurveSide(p3, p2, p1, p0, m2, m1, cdistance, radius)
         self.pen.closePath()
 
-    def drawLineWurst(self, p0, p1, radius, margin):
-        if distance(p0, p1) < radius:
+    def drawLineWurst(self, p0, p1, radius, margin, _hypot=math.hypot):
+        x0, y0 = p0
+        x1, y1 = p1
+        dx, dy = x0-x1, y0-y1
+        if dx*dx+dy*dy < radius*radius:
+            return
+        ldistance = _hypot(dx, dy)
+        if radius+margin >= ldistance:
+            # nothing is left of the line once the start is shortened
             return
 
-        p0 = splitLineAt(p0, p1, radius+margin)
-        p1 = splitLineAt(p1, p0, radius)
-
-        dx, dy = slope(p1, p0)
-        n = normalise(dx, dy)
+        # shorten the line on both ends, inlined splitLineAt
+        f = (radius+margin)/ldistance
+        x0, y0 = x0-f*dx, y0-f*dy
+        dx, dy = x0-x1, y0-y1
+        ldistance = _hypot(dx, dy)
+        if not ldistance:
+            return
+        f = radius/ldistance
+        x1, y1 = x1+f*dx, y1+f*dy
+        p0 = x0, y0
+        p1 = x1, y1
+
+        dx, dy = x0-x1, y0-y1
+        ldistance = _hypot(dx, dy)
+        inv = 1.0/ldistance if ldistance else 0.0
+        n = dx*inv, dy*inv
         m = n[1], -n[0]
 
-        start = offsetPoint(p0, m, -radius)
-        self.pen.moveTo(start)
-        self.drawWurstCap(p0, n, m, radius)
+        kr = self.capRadius*KAPPA
+
+        self.pen.moveTo((p0[0]-m[0]*radius, p0[1]-m[1]*radius))
+        self.drawWurstCap(p0, n, m, radius, self.capRadius, kr)
         self.drawWurstLineSide(p1, m, radius)
-        self.drawWurstCap(p1, n, m, -radius)
+        self.drawWurstCap(p1, n, m, -radius, -self.capRadius, -kr)
         self.pen.closePath()
 
 
+# Segments are cached as recorded pen calls, keyed by their points, radius
+# and margin, so only segments that actually changed are recomputed.
+
+@functools.lru_cache(maxsize=4096)
+def _computeLineWurst(p0, p1, radius, margin):
+    pen = RecordingPen()
+    WurstPen(None, pen, radius).drawLineWurst(p0, p1, radius, margin)
+    return tuple(pen.value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _computeCurveWurst(p0, p1, p2, p3, radius, margin):
+    pen = RecordingPen()
+    WurstPen(None, pen, radius).drawCurveWurst(p0, p1, p2, p3, radius, margin)
+    return tuple(pen.value)
+
+
 class MerzWurstPen(BasePen):
 
-    def __init__(self, merzLayer, color):
+    def __init__(self, pathLayer, color):
         BasePen.__init__(self, None)
-        self.merzLayer = merzLayer
-        self.color = color
+        # All sausages go into one compound path. For normal outlines they
+        # share the same orientation, so the non-zero fill draws their union.
+        # Looped or cusped curves can produce a self-intersecting sausage with
+        # the opposite winding; where it overlaps a neighbour the fill cancels
+        # out and leaves a hole in the preview. Tracing is not affected.
+        pathLayer.setFillColor(color)
+        self.path = pathLayer.getPen(clear=True)
 
     def _moveTo(self, pt):
-        pathLayer = self.merzLayer.appendPathSublayer()
-        pathLayer.setFillColor(self.color)
-        self.path = pathLayer.getPen()
-
         self.path.moveTo(pt)
 
     def _lineTo(self, pt):
@@ -339,6 +304,13 @@ def drawWurst(glyph, outPen, radius):
     glyph.draw(pen)
 
 
+def recordWurst(outline, radius):
+    # Works on a recorded outline only, so it is safe to run off the main thread.
+    pen = RecordingPen()
+    replayRecording(outline, WurstPen(None, pen, radius))
+    return pen.value
+
+
 class WurstDefaults:
 
     def wurstFromDefaults(self):
@@ -353,6 +325,9 @@ class WurstSchreiber(Subscriber, WurstDefaults):
 
     def build(self):
         self.wurstFromDefaults()
+        self._lastSig = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
 
         glyphEditor = self.getGlyphEditor()
         self.wurstLayer = glyphEditor.extensionContainer(
@@ -360,8 +335,11 @@ class WurstSchreiber(Subscriber, WurstDefaults):
             location='background',
             clear=True
         )
+        self.wurstPathLayer = self.wurstLayer.appendPathSublayer()
 
     def destroy(self):
+        self._lastSig = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.wurstLayer.clearSublayers()
 
     def wurstSchreiverUpdateGlyphEditor(self, info):
@@ -369,14 +347,23 @@ class WurstSchreiber(Subscriber, WurstDefaults):
         self.wurstLayer.setVisible(self.visible)
         self.drawWurst()
 
+    def wurstSchreiverUpdateWurstColor(self, info):
+        self.wurstFromDefaults()
+        self.wurstPathLayer.setFillColor(NSColorToRgba(self.color))
+
     def wurstSchreiverRemoveWurst(self, info):
         self.terminate()
 
     def glyphEditorDidSetGlyph(self, info):
+        if not self.visible:
+            return
+        self._lastSig = None
         self.drawWurst()
 
-    glyphEditorGlyphDidChangeDelay = 0
+    glyphEditorGlyphDidChangeDelay = 0.03
     def glyphEditorGlyphDidChange(self, info):
+        if not self.visible:
+            return
         self.drawWurst()
 
     def drawWurst(self):
@@ -384,14 +371,30 @@ class WurstSchreiber(Subscriber, WurstDefaults):
             glyph = self.getGlyphEditor().getGlyph()
             if glyph is None:
                 return
-            self.wurstLayer.clearSublayers()
+            # snapshot the decomposed outline here, compute the sausages on
+            # the worker and draw them into Merz back on the main thread
+            outline = DecomposingRecordingPen(glyph.layer)
+            glyph.draw(outline)
+
+            sig = (self.radius, tuple(outline.value))
+            if sig == self._lastSig:
+                return
+            self._lastSig = sig
 
-            pen = MerzWurstPen(
-                merzLayer=self.wurstLayer,
-                color= NSColorToRgba(self.color),
-            )
+            if self._pending is not None:
+                self._pending.cancel()
+            self._pending = self._executor.submit(recordWurst, outline.value, self.radius)
+            self._pending.add_done_callback(lambda future: callAfter(self.applyWurst, sig, future))
 
-            drawWurst(glyph, pen, self.radius)
+    def applyWurst(self, sig, future):
+        if future.cancelled() or sig is not self._lastSig:
+            # a newer outline is on its way
+            return
+        pen = MerzWurstPen(
+            pathLayer=self.wurstPathLayer,
+            color= NSColorToRgba(self.color),
+        )
+        replayRecording(future.result(), pen)
 
 
 class SliderGroup(vanilla.Group):
@@ -467,6 +470,7 @@ class WurstSchreiberController(WindowController, WurstDefaults):
             "Trace!",
             callback=self.traceButton
         )
+        self.options = self.getOptions()
         self.w.open()
 
     def getOptions(self):
@@ -481,20 +485,22 @@ class WurstSchreiberController(WindowController, WurstDefaults):
         setExtensionDefaultColor(f"{WurstSchreiberDefaultKey}.color", options["color"])
         setExtensionDefault(f"{WurstSchreiberDefaultKey}.radius", options["radius"])
         setExtensionDefault(f"{WurstSchreiberDefaultKey}.visible", options["visible"])
-        postEvent(f"{WurstSchreiberDefaultKey}.updateGlyphEditor")
+        changed = {key for key, value in options.items() if value != self.options[key]}
+        self.options = options
+        if changed == {"color"}:
+            # no geometry involved, just recolor the existing sublayers
+            postEvent(f"{WurstSchreiberDefaultKey}.updateWurstColor")
+        else:
+            postEvent(f"{WurstSchreiberDefaultKey}.updateGlyphEditor")
 
     def traceButton(self, sender):
         glyph = CurrentGlyph()
         options = self.getOptions()
-        pen = RecordingPen()
-
-        drawWurst(glyph, pen, options["radius"])
-
         background = glyph.getLayer("background")
 
         with background.undo("WurstTrace"):
             background.clear()
-            pen.replay(background.getPen())
+            drawWurst(glyph, background.getPen(), options["radius"])
             background.changed()
 
     def windowWillClose(self, window):
@@ -510,6 +516,18 @@ if f"{WurstSchreiberDefaultKey}.updateGlyphEditor" not in roboFontSubscriberEven
         delay=0.02,
     )
 
+
+if f"{WurstSchreiberDefaultKey}.updateWurstColor" not in roboFontSubscriberEventRegistry:
+    registerSubscriberEvent(
+        subscriberEventName=f"{WurstSchreiberDefaultKey}.updateWurstColor",
+        methodName="wurstSchreiverUpdateWurstColor",
+        lowLevelEventNames=[f"{WurstSchreiberDefaultKey}.updateWurstColor"],
+        dispatcher="roboFont",
+        delay=0.02,
+    )
+
+
+if f"{WurstSchreiberDefaultKey}.removeWurst" not in roboFontSubscriberEventRegistry:
     registerSubscriberEvent(
         subscriberEventName=f"{WurstSchreiberDefaultKey}.removeWurst",
         methodName="wurstSchreiverRemoveWurst",